@@ -1,2 +1,2 @@
 #!/bin/bash
-uv run uvicorn warehouse_app.app:create_app --reload --factory --host 0.0.0.0 --workers 1 --port 8000
\ No newline at end of file
+exec python -m warehouse_app.main
@@ -10,5 +10,7 @@ class Tags(Enum):
     ROLLS = "Rolls"
 
 
-api_router = APIRouter(prefix=f"{Config.urls.API_PREFIX}")
-api_router.include_router(rest.router, prefix="/rolls", tags=[Tags.ROLLS])
+def create_api_router() -> APIRouter:
+    api_router = APIRouter(prefix=f"{Config.urls.API_PREFIX}")
+    api_router.include_router(rest.router, prefix="/rolls", tags=[Tags.ROLLS])
+    return api_router
@@ -0,0 +1,53 @@
+import datetime
+import hashlib
+import json
+from typing import Any
+
+from fastapi import Request, Response, status
+
+
+def make_etag(scope: str, version: int, params: dict[str, Any]) -> str:
+    payload = json.dumps(params, default=str, sort_keys=True)
+    digest = hashlib.blake2b(f"{scope}:{version}:{payload}".encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return etag in {tag.strip().removeprefix("W/") for tag in header.split(",")}
+
+
+def cache_control_for_range(date_range: list[datetime.datetime], max_age: int) -> str:
+    if date_range[1] < datetime.datetime.now().astimezone().replace(tzinfo=None):
+        return f"public, max-age={max_age}"
+    return "no-cache"
+
+
+def cache_control_for_day(last_day: datetime.date, max_age: int) -> str:
+    if last_day < datetime.datetime.now().astimezone().date():
+        return f"public, max-age={max_age}"
+    return "no-cache"
+
+
+def conditional_response(
+    request: Request,
+    response: Response,
+    etag: str,
+    cache_control: str,
+) -> Response | None:
+    """
+    Returns a 304 response if the request already holds ``etag``.
+
+    Otherwise sets the validator headers on ``response`` and returns ``None``,
+    so the route goes on to build the full body.
+    """
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+    return None
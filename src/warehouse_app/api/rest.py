@@ -1,15 +1,27 @@
 from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 
 from warehouse_app.api.dependecies import get_roll_service
+from warehouse_app.api.http_cache import (
+    cache_control_for_day,
+    cache_control_for_range,
+    conditional_response,
+    make_etag,
+)
 from warehouse_app.api.schemas import (
+    FilterRollGroupedStatisticsParams,
     FilterRollParams,
+    FilterRollPercentilesParams,
     FilterRoolRangeDateParams,
+    RollPercentilesResponse,
+    RollPeriodStatisticsResponse,
     RollRequestCreate,
     RollResponse,
     RollStatisticsResponse,
 )
+from warehouse_app.core.config import Config
+from warehouse_app.core.sketch import sketch_days
 from warehouse_app.service.roll import RollService
 
 router = APIRouter()
@@ -17,24 +29,79 @@ router = APIRouter()
 
 @router.get("/", response_model=list[RollResponse], status_code=status.HTTP_200_OK)
 async def get_rolls(
+    request: Request,
+    response: Response,
     filter_query: Annotated[FilterRollParams, Query()],
     roll_service: Annotated[RollService, Depends(get_roll_service)],
 ) -> Any:
-    rolls = await roll_service.get_rolls(filter_query.model_dump())
+    filters = filter_query.model_dump()
+    etag = make_etag("rolls", await roll_service.get_version(), filters)
+    if not_modified := conditional_response(request, response, etag, "no-cache"):
+        return not_modified
+
+    rolls = await roll_service.get_rolls(filters)
     return [RollResponse.model_validate(roll) for roll in rolls]
 
 
 @router.get("/statistics/", response_model=RollStatisticsResponse, status_code=status.HTTP_200_OK)
 async def get_roll_statistics(
+    request: Request,
+    response: Response,
     date_params: Annotated[FilterRoolRangeDateParams, Query()],
     roll_service: Annotated[RollService, Depends(get_roll_service)],
 ) -> Any:
     date_range = date_params.model_dump()
+    etag = make_etag("statistics", await roll_service.get_version(), date_range)
+    # Storage time gaps and daily stock include later removals of rolls added in the range,
+    # so even a closed range changes after a delete and must be revalidated.
+    if not_modified := conditional_response(request, response, etag, "no-cache"):
+        return not_modified
+
     roll_statistic = await roll_service.get_statistic(date_range)
 
     return roll_statistic
 
 
+@router.get(
+    "/statistics/grouped/",
+    response_model=list[RollPeriodStatisticsResponse],
+    status_code=status.HTTP_200_OK,
+)
+async def get_roll_grouped_statistics(
+    request: Request,
+    response: Response,
+    group_params: Annotated[FilterRollGroupedStatisticsParams, Query()],
+    roll_service: Annotated[RollService, Depends(get_roll_service)],
+) -> Any:
+    params = group_params.model_dump()
+    version = await roll_service.get_version()
+    etag = make_etag("grouped_statistics", version, params)
+    cache_control = cache_control_for_range(group_params.date_range, Config.http_cache.CLOSED_RANGE_MAX_AGE)
+    if not_modified := conditional_response(request, response, etag, cache_control):
+        return not_modified
+
+    return await roll_service.get_grouped_statistic(
+        {"date_range": group_params.date_range}, group_params.group_by, version=version
+    )
+
+
+@router.get("/statistics/percentiles/", response_model=RollPercentilesResponse, status_code=status.HTTP_200_OK)
+async def get_roll_percentiles(
+    request: Request,
+    response: Response,
+    percentile_params: Annotated[FilterRollPercentilesParams, Query()],
+    roll_service: Annotated[RollService, Depends(get_roll_service)],
+) -> Any:
+    params = percentile_params.model_dump()
+    etag = make_etag("percentiles", await roll_service.get_version(), params)
+    _, end_day = sketch_days(*percentile_params.date_range)
+    cache_control = cache_control_for_day(end_day, Config.http_cache.CLOSED_RANGE_MAX_AGE)
+    if not_modified := conditional_response(request, response, etag, cache_control):
+        return not_modified
+
+    return await roll_service.get_percentiles({"date_range": percentile_params.date_range}, percentile_params.quantiles)
+
+
 @router.post("/", response_model=RollResponse, status_code=status.HTTP_201_CREATED)
 async def add_roll(
     roll_data: RollRequestCreate,
@@ -1,6 +1,13 @@
 import datetime
+from enum import StrEnum
+from typing import Annotated, Any
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+
+from warehouse_app.core.sketch import sketch_days
+
+RANGE_SEPARATOR = ".."
+MAX_STATISTICS_PERIODS = 366
 
 
 class RollRequestCreate(BaseModel):
@@ -33,21 +40,93 @@ class RollStatisticsResponse(BaseModel):
     day_max_weight: datetime.date | None = None
 
 
+class RollPeriodStatisticsResponse(BaseModel):
+    period_start: datetime.datetime
+    period_end: datetime.datetime
+    total_added: int
+    total_removed: int
+    avg_length: float
+    avg_weight: float
+    total_weight: float
+    min_max_roll_length: dict[str, float]
+    min_max_roll_weight: dict[str, float]
+    min_max_time_gap: dict[str, datetime.timedelta]
+
+
+class RollPercentilesResponse(BaseModel):
+    start_day: datetime.date = Field(..., description="First whole day merged into the percentiles")
+    end_day: datetime.date = Field(..., description="Last whole day merged into the percentiles (inclusive)")
+    relative_accuracy: float
+    weight: dict[str, float | None]
+    length: dict[str, float | None]
+    storage_time: dict[str, datetime.timedelta | None]
+
+
+class SketchMetric(StrEnum):
+    WEIGHT = "weight"
+    LENGTH = "length"
+    STORAGE_TIME = "storage_time"
+
+
+class StatisticsGroupBy(StrEnum):
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+
+
 class FilterRollBaseParams(BaseModel):
     model_config = {"extra": "forbid", "populate_by_name": True}
 
 
 class FilterRollParams(FilterRollBaseParams):
-    id: list[int] | None = Field(None, min_length=2, max_length=2, alias="id_range")
-    weight: list[float] | None = Field(None, min_length=2, max_length=2, alias="weight_range")
-    length: list[float] | None = Field(None, min_length=2, max_length=2, alias="length_range")
-    added_at: list[datetime.datetime] | None = Field(None, min_length=2, max_length=2, alias="added_range")
-    removed_at: list[datetime.datetime] | None = Field(None, min_length=2, max_length=2, alias="removed_range")
+    id: list[tuple[int | None, int | None]] | None = Field(None, min_length=1, max_length=10, alias="id_range")
+    id_in: list[int] | None = Field(None, min_length=1, max_length=1000, alias="ids")
+    weight: list[tuple[float | None, float | None]] | None = Field(
+        None, min_length=1, max_length=10, alias="weight_range"
+    )
+    length: list[tuple[float | None, float | None]] | None = Field(
+        None, min_length=1, max_length=10, alias="length_range"
+    )
+    created_at: list[tuple[datetime.datetime | None, datetime.datetime | None]] | None = Field(
+        None, min_length=1, max_length=10, alias="added_range"
+    )
+    removed_at: list[tuple[datetime.datetime | None, datetime.datetime | None]] | None = Field(
+        None, min_length=1, max_length=10, alias="removed_range"
+    )
+    in_stock: bool | None = None
+
+    @field_validator("id", "weight", "length", mode="before")
+    @classmethod
+    def validate_ranges(cls, value: list[str] | None) -> list[tuple[str | None, str | None]] | None:
+        return parse_ranges(value)
 
-    @field_validator("added_at", "removed_at", mode="before")
+    @field_validator("created_at", "removed_at", mode="before")
     @classmethod
-    def validate_dates(cls, value: str | list[datetime.datetime] | None) -> str | list[datetime.datetime] | None:
-        return validate_datetime_format(value)
+    def validate_dates(cls, value: list[str] | None) -> list[tuple[str | None, str | None]] | None:
+        ranges = parse_ranges(value)
+        for date_range in ranges or []:
+            for bound in date_range:
+                if isinstance(bound, str):
+                    validate_datetime_format(bound)
+        return ranges
+
+    @field_validator("created_at", "removed_at")
+    @classmethod
+    def validate_naive_dates(
+        cls, value: list[tuple[datetime.datetime | None, datetime.datetime | None]] | None
+    ) -> list[tuple[datetime.datetime | None, datetime.datetime | None]] | None:
+        if value:
+            validate_naive_datetimes([bound for date_range in value for bound in date_range if bound is not None])
+        return value
+
+    @field_validator("id", "weight", "length", "created_at", "removed_at")
+    @classmethod
+    def validate_ranges_order(cls, value: list[tuple[Any, Any]] | None) -> list[tuple[Any, Any]] | None:
+        for start, end in value or []:
+            if start is not None and end is not None and start > end:
+                msg = f"Invalid range: {start}..{end}. Start must not be greater than end."
+                raise ValueError(msg)
+        return value
 
 
 class FilterRoolRangeDateParams(FilterRollBaseParams):
@@ -58,6 +137,90 @@ class FilterRoolRangeDateParams(FilterRollBaseParams):
     def validate_dates(cls, value: str | list[datetime.datetime] | None) -> str | list[datetime.datetime] | None:
         return validate_datetime_format(value)
 
+    @field_validator("date_range")
+    @classmethod
+    def validate_naive_dates(cls, value: list[datetime.datetime]) -> list[datetime.datetime]:
+        return validate_naive_datetimes(value)
+
+
+class FilterRollGroupedStatisticsParams(FilterRoolRangeDateParams):
+    group_by: StatisticsGroupBy = StatisticsGroupBy.DAY
+
+    @model_validator(mode="after")
+    def validate_periods_count(self) -> "FilterRollGroupedStatisticsParams":
+        validate_date_range_order(self.date_range)
+        periods_count = count_periods(self.date_range[0], self.date_range[1], self.group_by)
+        if periods_count > MAX_STATISTICS_PERIODS:
+            msg: str = (
+                f"Date range spans {periods_count} periods of one {self.group_by}, "
+                f"at most {MAX_STATISTICS_PERIODS} are allowed. Use a coarser group_by or a shorter range."
+            )
+            raise ValueError(msg)
+        return self
+
+
+class FilterRollPercentilesParams(FilterRoolRangeDateParams):
+    quantiles: list[Annotated[float, Field(ge=0, le=1)]] = Field([0.5, 0.9, 0.99], min_length=1)
+
+    @model_validator(mode="after")
+    def validate_sketch_days(self) -> "FilterRollPercentilesParams":
+        validate_date_range_order(self.date_range)
+        start_day, end_day = sketch_days(self.date_range[0], self.date_range[1])
+        if end_day < start_day:
+            msg = "Date range covers no day, the end must be later than midnight of the start day."
+            raise ValueError(msg)
+        return self
+
+
+def count_periods(start: datetime.datetime, end: datetime.datetime, group_by: StatisticsGroupBy) -> int:
+    """
+    Counts the ``group_by`` buckets that start before ``end``.
+
+    Buckets are half-open, so a range ending exactly on a bucket boundary does not
+    open one more period: ``2024-01-01..2024-02-01`` is a single month.
+    """
+    last = end - datetime.timedelta(microseconds=1)
+    if group_by == StatisticsGroupBy.MONTH:
+        return (last.year - start.year) * 12 + last.month - start.month + 1
+    if group_by == StatisticsGroupBy.WEEK:
+        start_week = start.date() - datetime.timedelta(days=start.weekday())
+        last_week = last.date() - datetime.timedelta(days=last.weekday())
+        return (last_week - start_week).days // 7 + 1
+    return (last.date() - start.date()).days + 1
+
+
+def validate_date_range_order(date_range: list[datetime.datetime]) -> list[datetime.datetime]:
+    start, end = date_range
+    if start > end:
+        msg = f"Invalid date range: {start.isoformat()} is after {end.isoformat()}."
+        raise ValueError(msg)
+    return date_range
+
+
+def parse_ranges(value: list[str] | None) -> list[tuple[str | None, str | None]] | None:
+    """
+    Parses ``<from>..<to>`` range strings, either bound may be omitted.
+
+    Two values without a separator are accepted as a single range for compatibility
+    with the ``?id_range=1&id_range=5`` form.
+    """
+    if not isinstance(value, list):
+        return value
+    if len(value) == 2 and all(isinstance(item, str) and RANGE_SEPARATOR not in item for item in value):
+        return [(value[0], value[1])]
+
+    ranges = []
+    for item in value:
+        if not isinstance(item, str):
+            ranges.append(item)
+            continue
+        start, separator, end = item.partition(RANGE_SEPARATOR)
+        if not separator or not (start or end) or start.endswith(".") or end.startswith("."):
+            msg = f'Invalid range: {item}. Use "<from>..<to>" with at least one bound.'
+            raise ValueError(msg)
+        ranges.append((start or None, end or None))
+    return ranges
+
 
 def validate_datetime_format(value: str | list[datetime.datetime] | None) -> str | list[datetime.datetime] | None:
     if value is None:
@@ -72,3 +235,12 @@ def validate_datetime_format(value: str | list[datetime.datetime] | None) -> str
         raise ValueError(msg)
 
     return value
+
+
+def validate_naive_datetimes(value: list[datetime.datetime]) -> list[datetime.datetime]:
+    # Stored timestamps are naive, comparing them with offset-aware values raises TypeError.
+    for dt in value:
+        if dt.tzinfo is not None:
+            msg = f"Invalid datetime format: {dt.isoformat()}. Remove UTC offset."
+            raise ValueError(msg)
+    return value
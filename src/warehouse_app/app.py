@@ -1,12 +1,90 @@
+import asyncio
 import contextlib
+import datetime
+import logging
 from collections.abc import AsyncIterator
 
 from fastapi import FastAPI
 
-from warehouse_app.api import api_router
+from warehouse_app.api import create_api_router
+from warehouse_app.api.dependecies import get_roll_repository
+from warehouse_app.api.schemas import StatisticsGroupBy
 from warehouse_app.core.config import Config
 from warehouse_app.core.exc import DatabaseUnavailableError
 from warehouse_app.core.handlers import database_unavailable_exception_handler, generic_exception_handler
+from warehouse_app.database.connection import database_sqlalchemy_factory
+from warehouse_app.service.roll import RollService
+from warehouse_app.service.statistics_cache import SharedDailyStatistics
+
+# Roll writes stamp created_at/removed_at with the current time, so between full rebuilds
+# they can only change the most recent buckets. Yesterday is kept in the set to cover clock
+# differences between the application and the database server around midnight.
+DAYS_AFFECTED_BY_WRITES = 2
+
+logger = logging.getLogger(__name__)
+
+
+def whole_days_range(first_day: datetime.date, last_day: datetime.date) -> dict[str, list[datetime.datetime]]:
+    return {
+        "date_range": [
+            datetime.datetime.combine(first_day, datetime.time()),
+            datetime.datetime.combine(last_day + datetime.timedelta(days=1), datetime.time()),
+        ]
+    }
+
+
+async def publish_daily_statistics(app: FastAPI, statistics_cache: SharedDailyStatistics) -> None:
+    """
+    Brings the shared daily statistics window up to date.
+
+    The whole window is rebuilt when the current day changes or nothing valid is published.
+    Otherwise a new data version only recomputes the days that writes can affect.
+
+    Args:
+        app: FastAPI application instance.
+        statistics_cache: Shared statistics owned by this worker.
+    """
+    today = datetime.datetime.now().astimezone().date()
+    first_day = today - datetime.timedelta(days=statistics_cache.capacity_days - 1)
+
+    async with app.state.database_client.create_session() as session:
+        roll_service = RollService(roll_repo=await get_roll_repository(session))
+        version = await roll_service.get_version()
+        published_state = statistics_cache.published_state()
+        if published_state == (version, first_day):
+            return
+
+        if published_state is not None and published_state[1] == first_day:
+            recent_first_day = max(first_day, today - datetime.timedelta(days=DAYS_AFFECTED_BY_WRITES - 1))
+            periods = await roll_service.get_grouped_statistic(
+                whole_days_range(recent_first_day, today), StatisticsGroupBy.DAY
+            )
+            if statistics_cache.patch(version, periods):
+                return
+
+        periods = await roll_service.get_grouped_statistic(whole_days_range(first_day, today), StatisticsGroupBy.DAY)
+        statistics_cache.publish(version, first_day, periods)
+
+
+async def refresh_statistics_cache(app: FastAPI) -> None:
+    """
+    Keeps the shared daily statistics up to date.
+
+    Every worker runs this loop, but only the one holding the cache lock publishes.
+    If the owner exits, its lock is released and another worker takes over.
+    Failed refreshes are logged and retried on the next interval.
+
+    Args:
+        app: FastAPI application instance.
+    """
+    statistics_cache: SharedDailyStatistics = app.state.statistics_cache
+    while True:
+        try:
+            if statistics_cache.try_acquire_ownership():
+                await publish_daily_statistics(app, statistics_cache)
+        except Exception:
+            logger.exception("Failed to refresh shared daily statistics")
+        await asyncio.sleep(Config.statistics_cache.STATISTICS_CACHE_REFRESH_INTERVAL)
 
 
 @contextlib.asynccontextmanager
@@ -14,13 +92,31 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """
     Runs events before application startup and after application shutdown.
 
+    The database client is created here rather than at import time, so workers
+    only pay for settings parsing and engine construction once they start serving.
+
     Args:
         app: FastAPI application instance.
     """
+    app.state.database_client = database_sqlalchemy_factory(database_config=Config.database)
+    app.state.statistics_cache = None
+    refresh_task = None
+    if Config.statistics_cache.STATISTICS_CACHE_ENABLED:
+        app.state.statistics_cache = SharedDailyStatistics(
+            path=Config.statistics_cache.STATISTICS_CACHE_PATH,
+            capacity_days=Config.statistics_cache.STATISTICS_CACHE_DAYS,
+        )
+        refresh_task = asyncio.create_task(refresh_statistics_cache(app))
     try:
         yield
     finally:
-        pass
+        if refresh_task is not None:
+            refresh_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await refresh_task
+        if app.state.statistics_cache is not None:
+            app.state.statistics_cache.close()
+        await app.state.database_client.dispose()
 
 
 def create_app() -> FastAPI:
@@ -39,7 +135,7 @@ def create_app() -> FastAPI:
         lifespan=lifespan,
     )
 
-    app.include_router(router=api_router)
+    app.include_router(router=create_api_router())
 
     app.add_exception_handler(DatabaseUnavailableError, database_unavailable_exception_handler)
     app.add_exception_handler(Exception, generic_exception_handler)
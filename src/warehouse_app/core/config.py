@@ -1,3 +1,4 @@
+import functools
 from dataclasses import dataclass
 
 from pydantic_settings import BaseSettings
@@ -34,16 +35,52 @@ class UvicornConfig(BaseSettings):
     HOST: str = "localhost"
     PORT: int = 8000
     LOG_LEVEL: str = "info"
-    RELOAD: bool = True
+    RELOAD: bool = False
     FACTORY: bool = True
+    WORKERS: int = 1
 
 
-class Config:
+class HTTPCacheConfig(BaseSettings):
+    CLOSED_RANGE_MAX_AGE: int = 3600
+
+
+class StatisticsCacheConfig(BaseSettings):
+    STATISTICS_CACHE_ENABLED: bool = False
+    STATISTICS_CACHE_PATH: str = "/dev/shm/warehouse-statistics"
+    STATISTICS_CACHE_DAYS: int = 366
+    STATISTICS_CACHE_REFRESH_INTERVAL: float = 5.0
+
+
+class AppConfig:
     """
     Main configuration class for the application.
+
+    Every section is parsed from the environment on first access and cached afterwards.
     """
 
-    fastapi: FastAPIConfig = FastAPIConfig()
-    database: DatabaseConfig = DatabaseConfig()
-    uvicorn: UvicornConfig = UvicornConfig()
-    urls: URLPathsConfig = URLPathsConfig()
+    @functools.cached_property
+    def fastapi(self) -> FastAPIConfig:
+        return FastAPIConfig()
+
+    @functools.cached_property
+    def database(self) -> DatabaseConfig:
+        return DatabaseConfig()
+
+    @functools.cached_property
+    def uvicorn(self) -> UvicornConfig:
+        return UvicornConfig()
+
+    @functools.cached_property
+    def urls(self) -> URLPathsConfig:
+        return URLPathsConfig()
+
+    @functools.cached_property
+    def http_cache(self) -> HTTPCacheConfig:
+        return HTTPCacheConfig()
+
+    @functools.cached_property
+    def statistics_cache(self) -> StatisticsCacheConfig:
+        return StatisticsCacheConfig()
+
+
+Config = AppConfig()
@@ -0,0 +1,95 @@
+import dataclasses
+import datetime
+import math
+from typing import Any
+
+DEFAULT_RELATIVE_ACCURACY: float = 0.01
+
+
+def sketch_days(start: datetime.datetime, end: datetime.datetime) -> tuple[datetime.date, datetime.date]:
+    """
+    Returns the inclusive range of whole days whose daily sketches cover ``[start, end]``.
+
+    Sketches cannot be split within a day, so the start day is always taken whole and
+    the end day is included unless ``end`` falls exactly on midnight.
+    """
+    end_day = end.date()
+    if end.time() == datetime.time():
+        end_day -= datetime.timedelta(days=1)
+    return start.date(), end_day
+
+
+@dataclasses.dataclass(kw_only=True, slots=True)
+class QuantileSketch:
+    """
+    Mergeable quantile sketch with bounded relative error (DDSketch-style logarithmic buckets).
+
+    A positive value is counted in bucket ``ceil(log_gamma(value))`` with
+    ``gamma = (1 + relative_accuracy) / (1 - relative_accuracy)``, so every quantile
+    estimate is within ``relative_accuracy`` of an exact one. Merging adds bucket counts,
+    which makes the result independent of how the values were split between sketches.
+    """
+
+    relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY
+    zero_count: int = 0
+    bins: dict[int, int] = dataclasses.field(default_factory=dict)
+
+    @property
+    def gamma(self) -> float:
+        return (1 + self.relative_accuracy) / (1 - self.relative_accuracy)
+
+    @property
+    def count(self) -> int:
+        return self.zero_count + sum(self.bins.values())
+
+    def add(self, value: float) -> None:
+        if value <= 0:
+            self.zero_count += 1
+            return
+        index = math.ceil(math.log(value) / math.log(self.gamma))
+        self.bins[index] = self.bins.get(index, 0) + 1
+
+    def merge(self, other: "QuantileSketch") -> None:
+        if other.relative_accuracy != self.relative_accuracy:
+            msg: str = "Cannot merge sketches with different relative accuracy"
+            raise ValueError(msg)
+        self.zero_count += other.zero_count
+        for index, count in other.bins.items():
+            self.bins[index] = self.bins.get(index, 0) + count
+
+    def quantile(self, q: float) -> float | None:
+        if not 0 <= q <= 1:
+            msg: str = f"Quantile must be between 0 and 1, got {q}"
+            raise ValueError(msg)
+
+        total = self.count
+        if total == 0:
+            return None
+
+        rank = q * (total - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+
+        gamma = self.gamma
+        for index in sorted(self.bins):
+            seen += self.bins[index]
+            if rank < seen:
+                return 2 * gamma**index / (gamma + 1)
+
+        return 2 * gamma ** max(self.bins) / (gamma + 1)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "zero_count": self.zero_count,
+            "bins": {str(index): count for index, count in self.bins.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "QuantileSketch":
+        return cls(
+            relative_accuracy=data["relative_accuracy"],
+            zero_count=data["zero_count"],
+            bins={int(index): count for index, count in data["bins"].items()},
+        )
@@ -1,6 +1,8 @@
 __all__ = [
     "BaseORM",
+    "RollDailySketchORM",
     "RollORM",
+    "RollVersionORM",
 ]
 
-from .models import BaseORM, RollORM
+from .models import BaseORM, RollDailySketchORM, RollORM, RollVersionORM
@@ -3,6 +3,7 @@ from typing import Any, Protocol
 
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
+    AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
@@ -11,7 +12,13 @@ from warehouse_app.core.config import DatabaseConfig
 
 
 class DatabaseClient(Protocol):
-    async def async_session_dependency(self) -> AsyncGenerator[Any, Any]:
+    def async_session_dependency(self) -> AsyncGenerator[Any, Any]:
+        pass
+
+    def create_session(self) -> AsyncSession:
+        pass
+
+    async def dispose(self) -> None:
         pass
 
 
@@ -30,6 +37,12 @@ class DatabaseClientSQLAlchemy(DatabaseClient):
             yield session
             await session.close()
 
+    def create_session(self) -> AsyncSession:
+        return self._session_factory()
+
+    async def dispose(self) -> None:
+        await self._engine.dispose()
+
 
 def database_sqlalchemy_factory(database_config: DatabaseConfig) -> DatabaseClient:
     return DatabaseClientSQLAlchemy(
@@ -0,0 +1,32 @@
+"""Roll version table
+
+Revision ID: 3c8f27d1a9b4
+Revises: 6ed3011395a6
+Create Date: 2025-03-14 12:10:21.418305
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3c8f27d1a9b4"
+down_revision: str | None = "6ed3011395a6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    roll_version = op.create_table(
+        "roll_version",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("version", sa.BigInteger(), server_default="0", nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.bulk_insert(roll_version, [{"id": 1, "version": 0}])
+
+
+def downgrade() -> None:
+    op.drop_table("roll_version")
@@ -0,0 +1,70 @@
+"""Roll daily sketch table
+
+Revision ID: 9a41e6c2d7f0
+Revises: 3c8f27d1a9b4
+Create Date: 2025-03-17 09:45:02.731184
+
+"""
+
+import datetime
+import math
+from collections.abc import Sequence
+from typing import Any
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "9a41e6c2d7f0"
+down_revision: str | None = "3c8f27d1a9b4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Sketch format at the time of this revision, inlined so that later changes
+# to the application code do not change what the migration writes.
+RELATIVE_ACCURACY: float = 0.01
+GAMMA: float = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+
+
+def add_to_sketch(sketch: dict[str, Any], value: float) -> None:
+    if value <= 0:
+        sketch["zero_count"] += 1
+        return
+    index = str(math.ceil(math.log(value) / math.log(GAMMA)))
+    sketch["bins"][index] = sketch["bins"].get(index, 0) + 1
+
+
+def upgrade() -> None:
+    roll_daily_sketch = op.create_table(
+        "roll_daily_sketch",
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("metric", sa.String(length=32), nullable=False),
+        sa.Column("sketch", sa.JSON(), nullable=False),
+        sa.PrimaryKeyConstraint("day", "metric"),
+    )
+
+    # Backfill sketches for the existing history.
+    sketches: dict[tuple[datetime.date, str], dict[str, Any]] = {}
+
+    def add(day: datetime.date, metric: str, value: float) -> None:
+        sketch = sketches.setdefault(
+            (day, metric), {"relative_accuracy": RELATIVE_ACCURACY, "zero_count": 0, "bins": {}}
+        )
+        add_to_sketch(sketch, value)
+
+    rolls = op.get_bind().execute(sa.text("SELECT length, weight, created_at, removed_at FROM roll"))
+    for length, weight, created_at, removed_at in rolls:
+        add(created_at.date(), "length", float(length))
+        add(created_at.date(), "weight", float(weight))
+        if removed_at is not None:
+            add(removed_at.date(), "storage_time", (removed_at - created_at).total_seconds())
+
+    if sketches:
+        op.bulk_insert(
+            roll_daily_sketch,
+            [{"day": day, "metric": metric, "sketch": sketch} for (day, metric), sketch in sketches.items()],
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("roll_daily_sketch")
@@ -1,6 +1,7 @@
 import datetime
+from typing import Any
 
-from sqlalchemy import DateTime, Numeric
+from sqlalchemy import JSON, BigInteger, Date, DateTime, Numeric, String
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from sqlalchemy.sql import func
 
@@ -17,3 +18,18 @@ class RollORM(BaseORM):
     weight: Mapped[float] = mapped_column(Numeric, nullable=False)
     created_at: Mapped[datetime.datetime] = mapped_column(DateTime, server_default=func.now())
     removed_at: Mapped[datetime.datetime] = mapped_column(DateTime, nullable=True)
+
+
+class RollVersionORM(BaseORM):
+    __tablename__ = "roll_version"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default="0")
+
+
+class RollDailySketchORM(BaseORM):
+    __tablename__ = "roll_daily_sketch"
+
+    day: Mapped[datetime.date] = mapped_column(Date, primary_key=True)
+    metric: Mapped[str] = mapped_column(String(32), primary_key=True)
+    sketch: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
@@ -1,20 +1,42 @@
 import abc
 import datetime
-from typing import Any, Generic, TypeVar
+import functools
+from enum import StrEnum
+from typing import Any, ClassVar, Generic, TypeVar
 
 from pydantic import BaseModel
-from sqlalchemy import and_, or_, select
+from sqlalchemy import (
+    BindParameter,
+    ColumnClause,
+    ColumnElement,
+    Interval,
+    Row,
+    Select,
+    and_,
+    bindparam,
+    func,
+    literal_column,
+    or_,
+    select,
+)
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from warehouse_app.api.schemas import RollRequestCreate
+from warehouse_app.api.schemas import RollRequestCreate, SketchMetric, StatisticsGroupBy
 from warehouse_app.core.exc import DatabaseUnavailableError
-from warehouse_app.database.models import BaseORM, RollORM
+from warehouse_app.core.sketch import QuantileSketch
+from warehouse_app.database.models import BaseORM, RollDailySketchORM, RollORM, RollVersionORM
 
 T = TypeVar("T", bound=BaseORM)
 S = TypeVar("S", bound=BaseModel)
 
 
+class WriteOperation(StrEnum):
+    ADD = "add"
+    DELETE = "delete"
+
+
 class AbstractRepository(Generic[T, S], abc.ABC):
     @abc.abstractmethod
     async def get_by_id(self, model_id: int) -> T | None:
@@ -30,6 +52,8 @@ class AbstractRepository(Generic[T, S], abc.ABC):
 
 
 class SqlAlchemyRepository(AbstractRepository[T, S]):
+    _IN_FILTERS: ClassVar[dict[str, str]] = {}
+
     def __init__(self, session: AsyncSession, orm_model: type[T], pydantic_model: type[S]):
         self._session = session
         self._orm_model = orm_model
@@ -39,6 +63,9 @@ class SqlAlchemyRepository(AbstractRepository[T, S]):
         if not self._session.is_active:
             self._session = AsyncSession(self._session.bind)
 
+    async def _on_write(self, orm_instance: T, operation: WriteOperation) -> None:
+        pass
+
     async def get_by_id(self, model_id: int) -> T | None:
         await self._ensure_session()
         try:
@@ -53,28 +80,87 @@ class SqlAlchemyRepository(AbstractRepository[T, S]):
     async def get_all(self, filters: dict[str, Any] | None = None) -> list[T]:
         await self._ensure_session()
         try:
-            stmt = select(self._orm_model).order_by(self._orm_model.id)
-
-            criterias = []
+            shape, params = self._filter_shape(filters or {})
+            stmt = self._filter_statement(self._orm_model, shape)
 
-            for attr, value in filters.items():
-                column = getattr(self._orm_model, attr, None)
-
-                if column is None:
-                    continue
-                elif isinstance(value, list) and len(value) == 2:
-                    criterias.append(column.between(value[0], value[1]))
-
-            if criterias:
-                stmt = stmt.where(and_(*criterias))
-
-            result = await self._session.execute(stmt)
+            result = await self._session.execute(stmt, params)
             orm_instances = result.scalars().all()
             return orm_instances
         except SQLAlchemyError as exc:
             msg: str = "Error while getting data from database"
             raise DatabaseUnavailableError(msg) from exc
 
+    def _filter_shape(self, filters: dict[str, Any]) -> tuple[tuple[Any, ...], dict[str, Any]]:
+        """
+        Splits filters into a hashable shape and bind parameter values.
+
+        Shape entries are ``(attr, flag)`` for boolean flags, ``(attr, None)`` for
+        ``_IN_FILTERS`` lists and ``(attr, ((has_start, has_end), ...))`` for range lists.
+        """
+        shape: list[tuple[str, Any]] = []
+        params: dict[str, Any] = {}
+
+        for attr, value in sorted(filters.items()):
+            if value is None:
+                continue
+            elif isinstance(value, bool):
+                shape.append((attr, value))
+            elif attr in self._IN_FILTERS:
+                shape.append((attr, None))
+                params[attr] = list(value)
+            elif isinstance(value, list):
+                bounds = []
+                for index, (start, end) in enumerate(value):
+                    bounds.append((start is not None, end is not None))
+                    params[f"{attr}_{index}_start"] = start
+                    params[f"{attr}_{index}_end"] = end
+                shape.append((attr, tuple(bounds)))
+
+        return tuple(shape), params
+
+    @classmethod
+    @functools.lru_cache(maxsize=256)
+    def _filter_statement(cls, orm_model: type[T], shape: tuple[tuple[Any, ...], ...]) -> Select[tuple[T]]:
+        criterias = []
+
+        for attr, spec in shape:
+            if isinstance(spec, bool):
+                criteria = cls._flag_criteria(orm_model, attr, spec)
+            elif spec is None:
+                column = getattr(orm_model, cls._IN_FILTERS[attr], None)
+                criteria = None if column is None else column.in_(bindparam(attr, expanding=True))
+            else:
+                column = getattr(orm_model, attr, None)
+                criteria = None if column is None else or_(*cls._range_criterias(column, attr, spec))
+
+            if criteria is not None:
+                criterias.append(criteria)
+
+        stmt = select(orm_model).order_by(orm_model.id)
+        if criterias:
+            stmt = stmt.where(and_(*criterias))
+        return stmt
+
+    @classmethod
+    def _range_criterias(
+        cls, column: Any, attr: str, bounds: tuple[tuple[bool, bool], ...]
+    ) -> list[ColumnElement[bool]]:
+        criterias = []
+        for index, (has_start, has_end) in enumerate(bounds):
+            start: BindParameter[Any] = bindparam(f"{attr}_{index}_start")
+            end: BindParameter[Any] = bindparam(f"{attr}_{index}_end")
+            if has_start and has_end:
+                criterias.append(column.between(start, end))
+            elif has_start:
+                criterias.append(column >= start)
+            else:
+                criterias.append(column <= end)
+        return criterias
+
+    @classmethod
+    def _flag_criteria(cls, orm_model: type[T], attr: str, value: bool) -> ColumnElement[bool] | None:
+        return None
+
     async def add(self, model: S) -> T:
         await self._ensure_session()
         try:
@@ -82,6 +168,7 @@ class SqlAlchemyRepository(AbstractRepository[T, S]):
             self._session.add(orm_instance)
             await self._session.flush()
             await self._session.refresh(orm_instance)
+            await self._on_write(orm_instance, WriteOperation.ADD)
             await self._session.commit()
             return orm_instance
         except SQLAlchemyError as exc:
@@ -89,6 +176,7 @@ class SqlAlchemyRepository(AbstractRepository[T, S]):
             msg: str = "Error adding record to database"
             raise DatabaseUnavailableError(msg) from exc
 
+
 class RollAbstractReposity(SqlAlchemyRepository[RollORM, RollRequestCreate], abc.ABC):
     @abc.abstractmethod
     async def delete(self, model_id: int) -> RollORM | None:
@@ -100,17 +188,99 @@ class RollAbstractReposity(SqlAlchemyRepository[RollORM, RollRequestCreate], abc
     ) -> list[RollORM] | None:
         raise NotImplementedError()
 
+    @abc.abstractmethod
+    async def get_version(self) -> int:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def get_grouped_statistics(
+        self, date_range: dict[str, list[datetime.datetime]], group_by: StatisticsGroupBy
+    ) -> list[Row[Any]]:
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def get_daily_sketches(
+        self, start_day: datetime.date, end_day: datetime.date
+    ) -> dict[SketchMetric, list[QuantileSketch]]:
+        raise NotImplementedError()
+
 
 class RollReposity(RollAbstractReposity):
+    _VERSION_ROW_ID: int = 1
+    _IN_FILTERS: ClassVar[dict[str, str]] = {"id_in": "id"}
+
+    @classmethod
+    def _flag_criteria(cls, orm_model: type[RollORM], attr: str, value: bool) -> ColumnElement[bool] | None:
+        if attr == "in_stock":
+            return orm_model.removed_at.is_(None) if value else orm_model.removed_at.is_not(None)
+        return None
+
+    async def _on_write(self, orm_instance: RollORM, operation: WriteOperation) -> None:
+        stmt = (
+            insert(RollVersionORM)
+            .values(id=self._VERSION_ROW_ID, version=1)
+            .on_conflict_do_update(
+                index_elements=[RollVersionORM.id],
+                set_={"version": RollVersionORM.version + 1},
+            )
+        )
+        await self._session.execute(stmt)
+
+        if operation == WriteOperation.ADD:
+            day = orm_instance.created_at.date()
+            await self._add_to_daily_sketch(day, SketchMetric.WEIGHT, float(orm_instance.weight))
+            await self._add_to_daily_sketch(day, SketchMetric.LENGTH, float(orm_instance.length))
+        else:
+            storage_time = orm_instance.removed_at - orm_instance.created_at
+            await self._add_to_daily_sketch(
+                orm_instance.removed_at.date(), SketchMetric.STORAGE_TIME, storage_time.total_seconds()
+            )
+
+    async def _add_to_daily_sketch(self, day: datetime.date, metric: SketchMetric, value: float) -> None:
+        await self._session.execute(
+            insert(RollDailySketchORM)
+            .values(day=day, metric=metric.value, sketch=QuantileSketch().to_dict())
+            .on_conflict_do_nothing()
+        )
+        stmt = (
+            select(RollDailySketchORM)
+            .where(RollDailySketchORM.day == day, RollDailySketchORM.metric == metric.value)
+            .with_for_update()
+        )
+        daily_sketch = (await self._session.execute(stmt)).scalar_one()
+
+        sketch = QuantileSketch.from_dict(daily_sketch.sketch)
+        sketch.add(value)
+        daily_sketch.sketch = sketch.to_dict()
+
+    async def get_version(self) -> int:
+        await self._ensure_session()
+        try:
+            stmt = select(RollVersionORM.version).where(RollVersionORM.id == self._VERSION_ROW_ID)
+            result = await self._session.execute(stmt)
+            return result.scalar_one()
+        except SQLAlchemyError as exc:
+            msg: str = "Error while getting data version from database"
+            raise DatabaseUnavailableError(msg) from exc
+
     async def delete(self, model_id: int) -> RollORM | None:
         await self._ensure_session()
         try:
-            orm_instance = await self.get_by_id(model_id)
+            # Lock the roll so concurrent deletes cannot both record its storage time.
+            stmt = (
+                select(self._orm_model)
+                .where(self._orm_model.id == model_id)
+                .with_for_update()
+                .execution_options(populate_existing=True)
+            )
+            orm_instance = (await self._session.execute(stmt)).scalar_one_or_none()
             if orm_instance:
                 if orm_instance.removed_at:
+                    await self._session.rollback()
                     return None
                 orm_instance.removed_at = datetime.datetime.now()
                 self._session.add(orm_instance)
+                await self._on_write(orm_instance, WriteOperation.DELETE)
                 await self._session.commit()
                 return orm_instance
             return None
@@ -132,13 +302,13 @@ class RollReposity(RollAbstractReposity):
                 or_(
                     and_(self._orm_model.created_at >= start_date, self._orm_model.created_at <= end_date),
                     and_(
-                        self._orm_model.removed_at is not None,
+                        self._orm_model.removed_at.is_not(None),
                         self._orm_model.removed_at >= start_date,
                         self._orm_model.removed_at <= end_date,
                     ),
                     and_(
                         self._orm_model.created_at < start_date,
-                        or_(self._orm_model.removed_at is None, self._orm_model.removed_at > end_date),
+                        or_(self._orm_model.removed_at.is_(None), self._orm_model.removed_at > end_date),
                     ),
                 )
             )
@@ -149,3 +319,78 @@ class RollReposity(RollAbstractReposity):
         except SQLAlchemyError as exc:
             msg: str = "Error retrieving data for the period"
             raise DatabaseUnavailableError(msg) from exc
+
+    async def get_grouped_statistics(
+        self, date_range: dict[str, list[datetime.datetime]], group_by: StatisticsGroupBy
+    ) -> list[Row[Any]]:
+        await self._ensure_session()
+        try:
+            start_date, end_date = date_range["date_range"]
+            # group_by is a validated enum member, so it is safe to inline into the interval literal.
+            step: ColumnClause[datetime.timedelta] = literal_column(f"INTERVAL '1 {group_by.value}'", Interval)
+
+            bucket_start = func.generate_series(func.date_trunc(group_by.value, start_date), end_date, step)
+            buckets = select(bucket_start.label("bucket_start")).subquery("buckets")
+            period_start = func.greatest(buckets.c.bucket_start, start_date)
+            period_end = func.least(buckets.c.bucket_start + step, end_date)
+
+            created_in_period = and_(
+                self._orm_model.created_at >= period_start, self._orm_model.created_at < period_end
+            )
+            removed_in_period = and_(
+                self._orm_model.removed_at >= period_start, self._orm_model.removed_at < period_end
+            )
+            time_gap = self._orm_model.removed_at - self._orm_model.created_at
+
+            stmt = (
+                select(
+                    period_start.label("period_start"),
+                    period_end.label("period_end"),
+                    func.count(self._orm_model.id).filter(created_in_period).label("total_added"),
+                    func.count(self._orm_model.id).filter(removed_in_period).label("total_removed"),
+                    func.avg(self._orm_model.length).label("avg_length"),
+                    func.avg(self._orm_model.weight).label("avg_weight"),
+                    func.sum(self._orm_model.weight).label("total_weight"),
+                    func.min(self._orm_model.length).label("min_length"),
+                    func.max(self._orm_model.length).label("max_length"),
+                    func.min(self._orm_model.weight).label("min_weight"),
+                    func.max(self._orm_model.weight).label("max_weight"),
+                    func.min(time_gap).filter(removed_in_period).label("min_time_gap"),
+                    func.max(time_gap).filter(removed_in_period).label("max_time_gap"),
+                )
+                .select_from(buckets)
+                .outerjoin(
+                    self._orm_model,
+                    and_(
+                        self._orm_model.created_at < period_end,
+                        or_(self._orm_model.removed_at.is_(None), self._orm_model.removed_at >= period_start),
+                    ),
+                )
+                .where(buckets.c.bucket_start < end_date)
+                .group_by(buckets.c.bucket_start)
+                .order_by(buckets.c.bucket_start)
+            )
+
+            result = await self._session.execute(stmt)
+            return list(result.all())
+        except SQLAlchemyError as exc:
+            msg: str = "Error retrieving grouped statistics for the period"
+            raise DatabaseUnavailableError(msg) from exc
+
+    async def get_daily_sketches(
+        self, start_day: datetime.date, end_day: datetime.date
+    ) -> dict[SketchMetric, list[QuantileSketch]]:
+        await self._ensure_session()
+        try:
+            stmt = select(RollDailySketchORM.metric, RollDailySketchORM.sketch).where(
+                RollDailySketchORM.day >= start_day, RollDailySketchORM.day <= end_day
+            )
+            result = await self._session.execute(stmt)
+
+            sketches: dict[SketchMetric, list[QuantileSketch]] = {metric: [] for metric in SketchMetric}
+            for metric, sketch in result.all():
+                sketches[SketchMetric(metric)].append(QuantileSketch.from_dict(sketch))
+            return sketches
+        except SQLAlchemyError as exc:
+            msg: str = "Error retrieving daily sketches for the period"
+            raise DatabaseUnavailableError(msg) from exc
@@ -9,5 +9,6 @@ if __name__ == "__main__":
         port=Config.uvicorn.PORT,
         factory=Config.uvicorn.FACTORY,
         reload=Config.uvicorn.RELOAD,
+        workers=Config.uvicorn.WORKERS,
         log_level=Config.uvicorn.LOG_LEVEL,
     )
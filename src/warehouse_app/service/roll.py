@@ -1,17 +1,30 @@
 import dataclasses
 import decimal
 from collections import defaultdict
-from datetime import date, datetime, timedelta
+from datetime import date, datetime, time, timedelta
 from typing import Any
 
-from warehouse_app.api.schemas import RollRequestCreate, RollStatisticsResponse
+from warehouse_app.api.schemas import (
+    RollPercentilesResponse,
+    RollPeriodStatisticsResponse,
+    RollRequestCreate,
+    RollStatisticsResponse,
+    SketchMetric,
+    StatisticsGroupBy,
+)
+from warehouse_app.core.sketch import QuantileSketch, sketch_days
 from warehouse_app.database.models import RollORM
 from warehouse_app.database.repository import RollAbstractReposity
+from warehouse_app.service.statistics_cache import SharedDailyStatistics
 
 
 @dataclasses.dataclass(kw_only=True, frozen=True, slots=True)
 class RollService:
     roll_repo: RollAbstractReposity
+    statistics_cache: SharedDailyStatistics | None = None
+
+    async def get_version(self) -> int:
+        return await self.roll_repo.get_version()
 
     async def get_rolls(self, filters: dict[str, Any] | None = None) -> list[RollORM]:
         return await self.roll_repo.get_all(filters)
@@ -90,6 +103,80 @@ class RollService:
             day_max_weight=day_max_weight,
         )
 
+    async def get_grouped_statistic(
+        self,
+        date_range: dict[str, list[datetime]],
+        group_by: StatisticsGroupBy,
+        version: int | None = None,
+    ) -> list[RollPeriodStatisticsResponse]:
+        start_date, end_date = date_range["date_range"]
+        if (
+            version is not None
+            and self.statistics_cache is not None
+            and group_by == StatisticsGroupBy.DAY
+            and start_date.time() == time()
+            and end_date.time() == time()
+        ):
+            cached = self.statistics_cache.read(version, start_date.date(), end_date.date())
+            if cached is not None:
+                return cached
+
+        periods = await self.roll_repo.get_grouped_statistics(date_range, group_by)
+
+        return [
+            RollPeriodStatisticsResponse(
+                period_start=period.period_start,
+                period_end=period.period_end,
+                total_added=period.total_added,
+                total_removed=period.total_removed,
+                avg_length=period.avg_length or 0,
+                avg_weight=period.avg_weight or 0,
+                total_weight=period.total_weight or 0,
+                min_max_roll_length={
+                    "min_length": period.min_length or 0,
+                    "max_length": period.max_length or 0,
+                },
+                min_max_roll_weight={
+                    "min_weight": period.min_weight or 0,
+                    "max_weight": period.max_weight or 0,
+                },
+                min_max_time_gap={
+                    "min_time_gap": period.min_time_gap or timedelta(),
+                    "max_time_gap": period.max_time_gap or timedelta(),
+                },
+            )
+            for period in periods
+        ]
+
+    async def get_percentiles(
+        self, date_range: dict[str, list[datetime]], quantiles: list[float]
+    ) -> RollPercentilesResponse:
+        start_day, end_day = sketch_days(*date_range["date_range"])
+        daily_sketches = await self.roll_repo.get_daily_sketches(start_day, end_day)
+
+        merged: dict[SketchMetric, QuantileSketch] = {}
+        for metric, sketches in daily_sketches.items():
+            merged[metric] = QuantileSketch()
+            for sketch in sketches:
+                merged[metric].merge(sketch)
+
+        storage_time = self._calculate_quantiles(merged[SketchMetric.STORAGE_TIME], quantiles)
+
+        return RollPercentilesResponse(
+            start_day=start_day,
+            end_day=end_day,
+            relative_accuracy=merged[SketchMetric.WEIGHT].relative_accuracy,
+            weight=self._calculate_quantiles(merged[SketchMetric.WEIGHT], quantiles),
+            length=self._calculate_quantiles(merged[SketchMetric.LENGTH], quantiles),
+            storage_time={
+                name: timedelta(seconds=seconds) if seconds is not None else None
+                for name, seconds in storage_time.items()
+            },
+        )
+
+    def _calculate_quantiles(self, sketch: QuantileSketch, quantiles: list[float]) -> dict[str, float | None]:
+        return {f"p{quantile * 100:g}": sketch.quantile(quantile) for quantile in quantiles}
+
     def _get_days_with_min_and_max_period(self, stock_count: dict[date, Any]) -> tuple[date | None, date | None]:
         sorted_dates = sorted(stock_count.keys())
 
@@ -0,0 +1,187 @@
+import datetime
+import fcntl
+import mmap
+import os
+import struct
+from typing import Any
+
+from warehouse_app.api.schemas import RollPeriodStatisticsResponse
+
+# magic, generation, data version, first day ordinal, day count, capacity in days
+_HEADER = struct.Struct("<4s4xQQiII")
+# day ordinal, added, removed, avg length, avg weight, total weight,
+# min/max length, min/max weight, min/max time gap in seconds
+_RECORD = struct.Struct("<iII9d")
+_MAGIC = b"WHRS"
+
+
+class SharedDailyStatistics:
+    """
+    Daily grouped statistics shared by all worker processes through a memory-mapped file.
+
+    Only the worker holding the lock file publishes snapshots; every worker reads them
+    straight from the shared mapping. Writes are guarded by a sequence counter: it is odd
+    while a snapshot is being written, and readers that observe an odd or changed counter
+    treat the snapshot as missing and fall back to the database.
+    """
+
+    def __init__(self, path: str, capacity_days: int) -> None:
+        self._path = path
+        self._capacity_days = capacity_days
+        self._size = _HEADER.size + _RECORD.size * capacity_days
+        self._lock_fd: int | None = None
+        self._owner = False
+
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if os.fstat(fd).st_size < self._size:
+                os.ftruncate(fd, self._size)
+            self._mmap = mmap.mmap(fd, self._size)
+        finally:
+            os.close(fd)
+
+    @property
+    def capacity_days(self) -> int:
+        return self._capacity_days
+
+    def try_acquire_ownership(self) -> bool:
+        if self._owner:
+            return True
+
+        if self._lock_fd is None:
+            self._lock_fd = os.open(f"{self._path}.lock", os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+
+        self._owner = True
+        return True
+
+    def published_state(self) -> tuple[int, datetime.date] | None:
+        magic, generation, version, first_day, _, capacity_days = _HEADER.unpack_from(self._mmap, 0)
+        if magic != _MAGIC or generation % 2 or capacity_days != self._capacity_days:
+            return None
+        return version, datetime.date.fromordinal(first_day)
+
+    def publish(self, version: int, first_day: datetime.date, periods: list[RollPeriodStatisticsResponse]) -> None:
+        self._ensure_owner()
+        periods = periods[: self._capacity_days]
+
+        generation = self._begin_write()
+        for index, period in enumerate(periods):
+            self._pack_record(index, period)
+        _HEADER.pack_into(
+            self._mmap,
+            0,
+            _MAGIC,
+            generation + 1,
+            version,
+            first_day.toordinal(),
+            len(periods),
+            self._capacity_days,
+        )
+
+    def patch(self, version: int, periods: list[RollPeriodStatisticsResponse]) -> bool:
+        """
+        Overwrites already published days in place and moves the snapshot to ``version``.
+
+        Returns ``False`` without touching the mapping if any period lies outside the
+        published window, in which case the caller has to publish a full snapshot.
+        """
+        self._ensure_owner()
+        magic, generation, _, first_day, count, capacity_days = _HEADER.unpack_from(self._mmap, 0)
+        if magic != _MAGIC or generation % 2 or capacity_days != self._capacity_days:
+            return False
+
+        indexes = [period.period_start.toordinal() - first_day for period in periods]
+        if any(index < 0 or index >= count for index in indexes):
+            return False
+
+        generation = self._begin_write()
+        for index, period in zip(indexes, periods, strict=True):
+            self._pack_record(index, period)
+        _HEADER.pack_into(self._mmap, 0, _MAGIC, generation + 1, version, first_day, count, self._capacity_days)
+        return True
+
+    def read(
+        self, version: int, start_day: datetime.date, end_day: datetime.date
+    ) -> list[RollPeriodStatisticsResponse] | None:
+        magic, generation, published_version, first_day, count, capacity_days = _HEADER.unpack_from(self._mmap, 0)
+        if magic != _MAGIC or generation % 2 or published_version != version or capacity_days != self._capacity_days:
+            return None
+
+        offset = start_day.toordinal() - first_day
+        days = (end_day - start_day).days
+        if offset < 0 or days <= 0 or offset + days > min(count, self._capacity_days):
+            return None
+
+        view = memoryview(self._mmap)[
+            _HEADER.size + offset * _RECORD.size : _HEADER.size + (offset + days) * _RECORD.size
+        ]
+        try:
+            records = list(_RECORD.iter_unpack(view))
+        finally:
+            view.release()
+
+        if _HEADER.unpack_from(self._mmap, 0)[1] != generation:
+            return None
+
+        return [self._to_response(record) for record in records]
+
+    def close(self) -> None:
+        self._mmap.close()
+        if self._lock_fd is not None:
+            os.close(self._lock_fd)
+            self._lock_fd = None
+            self._owner = False
+
+    def _ensure_owner(self) -> None:
+        if not self._owner:
+            msg: str = "Only the owning worker can publish statistics"
+            raise RuntimeError(msg)
+
+    def _begin_write(self) -> int:
+        """Marks the snapshot as being written and returns the odd generation in use."""
+        _, generation, *header = _HEADER.unpack_from(self._mmap, 0)
+        generation += generation % 2 + 1
+        _HEADER.pack_into(self._mmap, 0, _MAGIC, generation, *header)
+        return generation
+
+    def _pack_record(self, index: int, period: RollPeriodStatisticsResponse) -> None:
+        _RECORD.pack_into(
+            self._mmap,
+            _HEADER.size + index * _RECORD.size,
+            period.period_start.toordinal(),
+            period.total_added,
+            period.total_removed,
+            period.avg_length,
+            period.avg_weight,
+            period.total_weight,
+            period.min_max_roll_length["min_length"],
+            period.min_max_roll_length["max_length"],
+            period.min_max_roll_weight["min_weight"],
+            period.min_max_roll_weight["max_weight"],
+            period.min_max_time_gap["min_time_gap"].total_seconds(),
+            period.min_max_time_gap["max_time_gap"].total_seconds(),
+        )
+
+    def _to_response(self, record: tuple[Any, ...]) -> RollPeriodStatisticsResponse:
+        day, added, removed, avg_length, avg_weight, total_weight, *min_max = record
+        min_length, max_length, min_weight, max_weight, min_time_gap, max_time_gap = min_max
+        period_start = datetime.datetime.combine(datetime.date.fromordinal(day), datetime.time())
+        return RollPeriodStatisticsResponse(
+            period_start=period_start,
+            period_end=period_start + datetime.timedelta(days=1),
+            total_added=added,
+            total_removed=removed,
+            avg_length=avg_length,
+            avg_weight=avg_weight,
+            total_weight=total_weight,
+            min_max_roll_length={"min_length": min_length, "max_length": max_length},
+            min_max_roll_weight={"min_weight": min_weight, "max_weight": max_weight},
+            min_max_time_gap={
+                "min_time_gap": datetime.timedelta(seconds=min_time_gap),
+                "max_time_gap": datetime.timedelta(seconds=max_time_gap),
+            },
+        )
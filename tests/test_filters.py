@@ -0,0 +1,69 @@
+import pytest
+from pydantic import ValidationError
+
+from warehouse_app.api.schemas import FilterRollParams, RollRequestCreate, parse_ranges
+from warehouse_app.database.models import RollORM
+from warehouse_app.database.repository import RollReposity
+
+
+def make_repository() -> RollReposity:
+    return RollReposity(session=None, orm_model=RollORM, pydantic_model=RollRequestCreate)  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (None, None),
+        (["1..5"], [("1", "5")]),
+        (["..5", "10.."], [(None, "5"), ("10", None)]),
+        (["1.5..2.5"], [("1.5", "2.5")]),
+        (["1", "5"], [("1", "5")]),
+        (["2024-01-01T00:00:00..2024-02-01T00:00:00"], [("2024-01-01T00:00:00", "2024-02-01T00:00:00")]),
+    ],
+)
+def test_parse_ranges(value: list[str] | None, expected: list[tuple[str | None, str | None]] | None) -> None:
+    assert parse_ranges(value) == expected
+
+
+@pytest.mark.parametrize("value", [["5"], [".."], ["1...2"], ["1....2"], ["1..5", "7"]])
+def test_parse_ranges_rejects_malformed(value: list[str]) -> None:
+    with pytest.raises(ValueError, match="Invalid range"):
+        parse_ranges(value)
+
+
+def test_filter_params_reject_reversed_range() -> None:
+    with pytest.raises(ValidationError, match="Start must not be greater than end"):
+        FilterRollParams(weight_range=["5..1"])
+
+
+def test_filter_params_reject_z_suffix() -> None:
+    with pytest.raises(ValidationError, match='Remove "Z" suffix'):
+        FilterRollParams(added_range=["2024-01-01T00:00:00Z.."])
+
+
+@pytest.mark.parametrize(
+    "added_range",
+    [["2024-01-01T00:00:00+03:00..2024-01-02T00:00:00"], ["2024-01-01T00:00:00..2024-01-02T00:00:00+03:00"]],
+)
+def test_filter_params_reject_offset_aware_dates(added_range: list[str]) -> None:
+    with pytest.raises(ValidationError, match="Remove UTC offset"):
+        FilterRollParams(added_range=added_range)
+
+
+def test_filter_shape() -> None:
+    params = FilterRollParams(id_range=["1..5", "10.."], ids=[7, 8], in_stock=True)
+    repository = make_repository()
+
+    shape, values = repository._filter_shape(params.model_dump())
+
+    assert shape == (("id", ((True, True), (True, False))), ("id_in", None), ("in_stock", True))
+    assert values == {"id_0_start": 1, "id_0_end": 5, "id_1_start": 10, "id_1_end": None, "id_in": [7, 8]}
+
+
+def test_filter_shape_ignores_bound_values() -> None:
+    repository = make_repository()
+
+    first, _ = repository._filter_shape(FilterRollParams(added_range=["2024-01-01T00:00:00.."]).model_dump())
+    second, _ = repository._filter_shape(FilterRollParams(added_range=["2024-02-01T00:00:00.."]).model_dump())
+
+    assert first == second
@@ -0,0 +1,53 @@
+import datetime
+
+import pytest
+from pydantic import ValidationError
+
+from warehouse_app.api.schemas import (
+    MAX_STATISTICS_PERIODS,
+    FilterRollGroupedStatisticsParams,
+    StatisticsGroupBy,
+    count_periods,
+)
+
+
+def at(value: str) -> datetime.datetime:
+    return datetime.datetime.fromisoformat(value)
+
+
+@pytest.mark.parametrize(
+    ("start", "end", "group_by", "expected"),
+    [
+        ("2024-01-01T00:00:00", "2025-01-01T00:00:00", StatisticsGroupBy.DAY, 366),
+        ("2024-01-01T00:00:00", "2024-01-02T00:00:00", StatisticsGroupBy.DAY, 1),
+        ("2024-01-01T00:00:00", "2024-01-02T00:00:01", StatisticsGroupBy.DAY, 2),
+        ("2024-01-01T12:00:00", "2024-01-01T12:00:00", StatisticsGroupBy.DAY, 1),
+        ("2024-01-01T00:00:00", "2024-01-01T00:00:00", StatisticsGroupBy.DAY, 0),
+        ("2024-01-01T00:00:00", "2024-02-01T00:00:00", StatisticsGroupBy.MONTH, 1),
+        ("2024-01-15T00:00:00", "2024-02-15T00:00:00", StatisticsGroupBy.MONTH, 2),
+        ("2023-12-01T00:00:00", "2024-03-01T00:00:00", StatisticsGroupBy.MONTH, 3),
+        ("2024-01-01T00:00:00", "2024-01-15T00:00:00", StatisticsGroupBy.WEEK, 2),
+        ("2024-01-03T00:00:00", "2024-01-08T00:00:01", StatisticsGroupBy.WEEK, 2),
+        ("2024-01-03T00:00:00", "2024-01-07T23:00:00", StatisticsGroupBy.WEEK, 1),
+    ],
+)
+def test_count_periods(start: str, end: str, group_by: StatisticsGroupBy, expected: int) -> None:
+    assert count_periods(at(start), at(end), group_by) == expected
+
+
+def test_grouped_params_accept_full_period_limit() -> None:
+    params = FilterRollGroupedStatisticsParams(date_range=["2024-01-01T00:00:00", "2025-01-01T00:00:00"])
+
+    assert count_periods(*params.date_range, params.group_by) == MAX_STATISTICS_PERIODS
+
+
+def test_grouped_params_reject_too_many_periods() -> None:
+    with pytest.raises(ValidationError, match="367 periods"):
+        FilterRollGroupedStatisticsParams(date_range=["2024-01-01T00:00:00", "2025-01-02T00:00:00"])
+
+
+def test_grouped_params_reject_reversed_range() -> None:
+    with pytest.raises(ValidationError, match="Invalid date range"):
+        FilterRollGroupedStatisticsParams(
+            date_range=["2024-02-01T00:00:00", "2024-01-01T00:00:00"], group_by=StatisticsGroupBy.MONTH
+        )
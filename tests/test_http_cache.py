@@ -0,0 +1,91 @@
+import datetime
+
+import pytest
+from fastapi import Request, Response, status
+from pydantic import ValidationError
+
+from warehouse_app.api.http_cache import (
+    cache_control_for_day,
+    cache_control_for_range,
+    conditional_response,
+    etag_matches,
+    make_etag,
+)
+from warehouse_app.api.schemas import FilterRoolRangeDateParams
+
+PAST = datetime.datetime.combine(datetime.date(2000, 1, 1), datetime.time())
+FUTURE = datetime.datetime.combine(datetime.date(3000, 1, 1), datetime.time())
+
+
+def make_request(if_none_match: str | None = None) -> Request:
+    headers = [] if if_none_match is None else [(b"if-none-match", if_none_match.encode())]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+def test_make_etag_is_stable_and_quoted() -> None:
+    etag = make_etag("rolls", 1, {"b": 2, "a": [1, 2]})
+
+    assert etag == make_etag("rolls", 1, {"a": [1, 2], "b": 2})
+    assert etag.startswith('"') and etag.endswith('"')
+
+
+@pytest.mark.parametrize(
+    ("scope", "version", "params"),
+    [("statistics", 1, {"a": 1}), ("rolls", 2, {"a": 1}), ("rolls", 1, {"a": 2})],
+)
+def test_make_etag_changes_with_inputs(scope: str, version: int, params: dict[str, int]) -> None:
+    assert make_etag(scope, version, params) != make_etag("rolls", 1, {"a": 1})
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (None, False),
+        ('"abc"', True),
+        ('W/"abc"', True),
+        ('"other", W/"abc"', True),
+        ("*", True),
+        ('"other"', False),
+        ("abc", False),
+    ],
+)
+def test_etag_matches(header: str | None, expected: bool) -> None:
+    assert etag_matches(make_request(header), '"abc"') is expected
+
+
+def test_conditional_response_not_modified() -> None:
+    response = Response()
+
+    not_modified = conditional_response(make_request('"abc"'), response, '"abc"', "no-cache")
+
+    assert not_modified is not None
+    assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+    assert not_modified.headers["etag"] == '"abc"'
+    assert not_modified.headers["cache-control"] == "no-cache"
+
+
+def test_conditional_response_sets_validators() -> None:
+    response = Response()
+
+    assert conditional_response(make_request('"other"'), response, '"abc"', "public, max-age=60") is None
+    assert response.headers["etag"] == '"abc"'
+    assert response.headers["cache-control"] == "public, max-age=60"
+
+
+@pytest.mark.parametrize(
+    ("date_range", "expected"),
+    [([PAST, PAST], "public, max-age=60"), ([PAST, FUTURE], "no-cache")],
+)
+def test_cache_control_for_range(date_range: list[datetime.datetime], expected: str) -> None:
+    assert cache_control_for_range(date_range, 60) == expected
+
+
+@pytest.mark.parametrize(("last_day", "expected"), [(PAST.date(), "public, max-age=60"), (FUTURE.date(), "no-cache")])
+def test_cache_control_for_day(last_day: datetime.date, expected: str) -> None:
+    assert cache_control_for_day(last_day, 60) == expected
+
+
+@pytest.mark.parametrize("start", ["2024-01-01T00:00:00+03:00", "2024-01-01T00:00:00Z", "1704067200"])
+def test_date_range_rejects_offset_aware_values(start: str) -> None:
+    with pytest.raises(ValidationError, match="Invalid datetime format"):
+        FilterRoolRangeDateParams(date_range=[start, "2024-02-01T00:00:00"])
@@ -0,0 +1,113 @@
+import datetime
+import random
+
+import pytest
+from pydantic import ValidationError
+
+from warehouse_app.api.schemas import FilterRollPercentilesParams
+from warehouse_app.core.sketch import QuantileSketch, sketch_days
+
+QUANTILES = [0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99]
+
+
+def lognormal_values(count: int) -> list[float]:
+    generator = random.Random(42)
+    return [generator.lognormvariate(3, 1.5) for _ in range(count)]
+
+
+def exact_quantile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+def make_sketch(values: list[float]) -> QuantileSketch:
+    sketch = QuantileSketch()
+    for value in values:
+        sketch.add(value)
+    return sketch
+
+
+def test_quantiles_within_relative_accuracy() -> None:
+    values = lognormal_values(20_000)
+    sketch = make_sketch(values)
+
+    for q in QUANTILES:
+        exact = exact_quantile(values, q)
+        estimate = sketch.quantile(q)
+        assert estimate is not None
+        assert abs(estimate - exact) <= sketch.relative_accuracy * exact
+
+
+def test_merge_is_independent_of_split() -> None:
+    values = lognormal_values(20_000)
+    whole = make_sketch(values)
+
+    merged = QuantileSketch()
+    for part in (values[:7_000], values[7_000:12_000], values[12_000:]):
+        merged.merge(make_sketch(part))
+    reversed_merge = QuantileSketch()
+    for part in (values[12_000:], values[:7_000], values[7_000:12_000]):
+        reversed_merge.merge(make_sketch(part))
+
+    assert merged == whole
+    assert reversed_merge == whole
+
+
+def test_empty_sketch_has_no_quantiles() -> None:
+    assert QuantileSketch().quantile(0.5) is None
+
+
+def test_non_positive_values_count_as_zero() -> None:
+    sketch = make_sketch([0, -1, 5])
+
+    assert sketch.count == 3
+    assert sketch.quantile(0.5) == 0.0
+
+
+def test_quantile_out_of_bounds() -> None:
+    with pytest.raises(ValueError, match="between 0 and 1"):
+        make_sketch([1]).quantile(1.5)
+
+
+def test_merge_rejects_different_accuracy() -> None:
+    with pytest.raises(ValueError, match="different relative accuracy"):
+        QuantileSketch().merge(QuantileSketch(relative_accuracy=0.05))
+
+
+def test_dict_round_trip() -> None:
+    sketch = make_sketch([0, 1.5, 2.5, 100])
+
+    assert QuantileSketch.from_dict(sketch.to_dict()) == sketch
+
+
+@pytest.mark.parametrize(
+    ("start", "end", "expected"),
+    [
+        ("2024-01-01T00:00:00", "2024-02-01T00:00:00", ("2024-01-01", "2024-01-31")),
+        ("2024-01-01T12:00:00", "2024-01-02T00:00:01", ("2024-01-01", "2024-01-02")),
+        ("2024-01-01T00:00:00", "2024-01-01T06:00:00", ("2024-01-01", "2024-01-01")),
+        ("2024-01-01T00:00:00", "2024-01-01T00:00:00", ("2024-01-01", "2023-12-31")),
+    ],
+)
+def test_sketch_days(start: str, end: str, expected: tuple[str, str]) -> None:
+    days = sketch_days(datetime.datetime.fromisoformat(start), datetime.datetime.fromisoformat(end))
+
+    assert days == tuple(datetime.date.fromisoformat(day) for day in expected)
+
+
+@pytest.mark.parametrize(
+    ("date_range", "message"),
+    [
+        (["2024-01-01T00:00:00", "2024-01-01T00:00:00"], "covers no day"),
+        (["2024-01-02T00:00:00", "2024-01-01T00:00:00"], "Invalid date range"),
+    ],
+)
+def test_percentiles_params_reject_empty_ranges(date_range: list[str], message: str) -> None:
+    with pytest.raises(ValidationError, match=message):
+        FilterRollPercentilesParams(date_range=date_range)
+
+
+def test_percentiles_params_accept_partial_day() -> None:
+    params = FilterRollPercentilesParams(date_range=["2024-01-01T00:00:00", "2024-01-01T06:00:00"])
+
+    assert sketch_days(*params.date_range) == (datetime.date(2024, 1, 1), datetime.date(2024, 1, 1))
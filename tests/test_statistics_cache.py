@@ -0,0 +1,102 @@
+import datetime
+from pathlib import Path
+
+import pytest
+
+from warehouse_app.api.schemas import RollPeriodStatisticsResponse
+from warehouse_app.service.statistics_cache import SharedDailyStatistics
+
+FIRST_DAY = datetime.date(2024, 1, 1)
+
+
+def make_period(day: datetime.date, total_added: int) -> RollPeriodStatisticsResponse:
+    period_start = datetime.datetime.combine(day, datetime.time())
+    return RollPeriodStatisticsResponse(
+        period_start=period_start,
+        period_end=period_start + datetime.timedelta(days=1),
+        total_added=total_added,
+        total_removed=0,
+        avg_length=1.5,
+        avg_weight=2.5,
+        total_weight=2.5 * total_added,
+        min_max_roll_length={"min_length": 1, "max_length": 2},
+        min_max_roll_weight={"min_weight": 2, "max_weight": 3},
+        min_max_time_gap={"min_time_gap": datetime.timedelta(hours=1), "max_time_gap": datetime.timedelta(days=2)},
+    )
+
+
+def make_periods(days: int) -> list[RollPeriodStatisticsResponse]:
+    return [make_period(FIRST_DAY + datetime.timedelta(days=index), index) for index in range(days)]
+
+
+@pytest.fixture
+def cache_path(tmp_path: Path) -> str:
+    return str(tmp_path / "statistics")
+
+
+def test_read_returns_published_days(cache_path: str) -> None:
+    cache = SharedDailyStatistics(cache_path, 5)
+    assert cache.try_acquire_ownership()
+    cache.publish(7, FIRST_DAY, make_periods(5))
+
+    periods = cache.read(7, FIRST_DAY + datetime.timedelta(days=1), FIRST_DAY + datetime.timedelta(days=3))
+
+    assert periods == make_periods(5)[1:3]
+    cache.close()
+
+
+def test_read_misses_on_other_version_or_range_outside_window(cache_path: str) -> None:
+    cache = SharedDailyStatistics(cache_path, 5)
+    assert cache.try_acquire_ownership()
+    cache.publish(7, FIRST_DAY, make_periods(5))
+
+    assert cache.read(8, FIRST_DAY, FIRST_DAY + datetime.timedelta(days=1)) is None
+    assert cache.read(7, FIRST_DAY - datetime.timedelta(days=1), FIRST_DAY) is None
+    assert cache.read(7, FIRST_DAY, FIRST_DAY + datetime.timedelta(days=6)) is None
+    cache.close()
+
+
+def test_read_rejects_snapshot_published_with_other_capacity(cache_path: str) -> None:
+    writer = SharedDailyStatistics(cache_path, 5)
+    assert writer.try_acquire_ownership()
+    writer.publish(7, FIRST_DAY, make_periods(5))
+    writer.close()
+
+    reader = SharedDailyStatistics(cache_path, 3)
+
+    assert reader.read(7, FIRST_DAY, FIRST_DAY + datetime.timedelta(days=5)) is None
+    assert reader.read(7, FIRST_DAY, FIRST_DAY + datetime.timedelta(days=2)) is None
+    assert reader.published_state() is None
+    reader.close()
+
+
+def test_only_one_instance_owns_the_cache(cache_path: str) -> None:
+    owner = SharedDailyStatistics(cache_path, 5)
+    other = SharedDailyStatistics(cache_path, 5)
+
+    assert owner.try_acquire_ownership()
+    assert not other.try_acquire_ownership()
+    with pytest.raises(RuntimeError):
+        other.publish(1, FIRST_DAY, make_periods(5))
+
+    owner.close()
+    assert other.try_acquire_ownership()
+    other.close()
+
+
+def test_patch_updates_days_in_place(cache_path: str) -> None:
+    cache = SharedDailyStatistics(cache_path, 5)
+    assert cache.try_acquire_ownership()
+    cache.publish(7, FIRST_DAY, make_periods(5))
+    last_day = FIRST_DAY + datetime.timedelta(days=4)
+
+    assert cache.patch(8, [make_period(last_day, 42)])
+
+    assert cache.published_state() == (8, FIRST_DAY)
+    assert cache.read(8, FIRST_DAY, last_day + datetime.timedelta(days=1)) == [
+        *make_periods(4),
+        make_period(last_day, 42),
+    ]
+    assert not cache.patch(9, [make_period(last_day + datetime.timedelta(days=1), 1)])
+    assert cache.published_state() == (8, FIRST_DAY)
+    cache.close()